@@ -2,53 +2,104 @@ from flask import Flask, jsonify, render_template, request
 from flask_socketio import SocketIO, emit
 import time
 import threading
-from collections import deque
+from statistics import median
 from hx711_custom import HX711Custom
-import numpy as np
+from running_deque import RunningDeque
 import psutil
 
+try:
+    import orjson
+except ImportError:  # optional, Flask-SocketIO falls back to the stdlib json
+    orjson = None
+
+
+class OrjsonModule:
+    """json-module shim so Flask-SocketIO encodes packets with orjson."""
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
-socketio = SocketIO(app)
+socketio = SocketIO(app, **({'json': OrjsonModule} if orjson else {}))
 
 # Initialize the scale
 scale = HX711Custom(dout_pin=5, pd_sck_pin=6)
 
 # Global variables
-weights = deque(maxlen=100)  # Use deque with a max length to limit memory usage
+weights = RunningDeque(maxlen=100)  # Weights of the current tracking with a running sum for the average
 peak_weight = 0
 tracking = False
-start_time = 0
-off_time = 0
+start_time = 0  # time.monotonic_ns() when tracking started, 0 if not tracking
+off_time = 0  # time.monotonic_ns() when tracking timed out, 0 if not set
 tracking_duration = 0
+tracking_duration_ns = 0  # tracking_duration converted once for the sensor loop
 min_weight = 500  # Default minimum weight to start the timer
 current_weight = 1
-raw_weights = deque(maxlen=1000)  # A larger buffer to hold raw data for filtering
+raw_weights = RunningDeque(maxlen=100)  # A few seconds of raw data for the outlier filter
+debug = False  # Print memory usage from the sensor loop
+memory_report_interval = 256  # Samples between memory usage prints in debug mode
+process = psutil.Process()
 
 def print_memory_usage():
-    process = psutil.Process()
     print(f"Memory Usage: {process.memory_info().rss / 1024 ** 2:.2f} MB")
 
 
+def median3(a, b, c):
+    return max(min(a, b), min(max(a, b), c))
+
+
 def rolling_median_filter(data, window_size):
     if len(data) < window_size:
         return data[-1]  # Not enough data points to apply the filter
-    window = np.array(list(data)[-window_size:])
-    median = np.median(window)
-    return median
+    if window_size == 3:
+        return median3(data[-1], data[-2], data[-3])
+    # index from the right end only, the deque is not copied
+    return median([data[i] for i in range(-window_size, 0)])
 
 
 
+def build_response(now_ns):
+    avg_weight = round(weights.mean() / 1000, 1) if weights else 0
+    elapsed_time = round((now_ns - start_time) / 1e9, 2) if start_time and tracking else 0
+    return {
+        'weight': round(current_weight / 1000, 1),
+        'peak_weight': round(peak_weight / 1000, 1),
+        'avg_weight': avg_weight,
+        'elapsed_time': elapsed_time,
+        'tracking': tracking,
+        'clear_chart': len(weights) == 1  # Clear chart if only one weight entry (new tracking started)
+    }
+
+
 def read_sensor():
-    global peak_weight, start_time, tracking, tracking_duration, current_weight, off_time
+    global peak_weight, start_time, tracking, current_weight, off_time
     window_size = 3
     last_emit_time = 0
-    emit_interval = 0.025  # seconds
+    last_response = None
+    emit_interval = 25_000_000  # nanoseconds
+    off_cooldown = 2_000_000_000  # nanoseconds to wait after a timed out tracking
+
+    # Bind hot-loop lookups to locals once instead of on every sample
+    get_weight = scale.get_weight
+    now = time.monotonic_ns
+    sleep = time.sleep
+    socket_emit = socketio.emit
+    sample_count = 0
 
     while True:
-        print_memory_usage()
+        loop_start = now()
+        sample_count += 1
+        if debug and sample_count % memory_report_interval == 0:
+            print_memory_usage()
         try:
-            weight = scale.get_weight()
+            weight = get_weight()
+            now_ns = now()  # one clock read per sample, taken after the blocking read
             if weight is False or weight < 0:
                 weight = current_weight
 
@@ -57,52 +108,51 @@ def read_sensor():
             if weight is not None:
                 raw_weights.append(weight)
                 smoothed_weight = rolling_median_filter(raw_weights, window_size)
-                if np.abs(weight - smoothed_weight) > 3 * np.std(raw_weights):
+                if abs(weight - smoothed_weight) > 3 * raw_weights.std():
                     continue
 
-                if smoothed_weight > min_weight and (time.time() - off_time > 2):
+                if smoothed_weight > min_weight and (off_time == 0 or now_ns - off_time > off_cooldown):
                     if not tracking:
                         off_time = 0
                         tracking = True
                         weights.clear()
                         peak_weight = 0
-                        start_time = time.time()
+                        start_time = now_ns
 
                     weights.append(weight)
 
                     if smoothed_weight > peak_weight:
                         peak_weight = smoothed_weight
 
-                    if (time.time() - start_time > tracking_duration) and tracking_duration != 0:
+                    if tracking_duration_ns and now_ns - start_time > tracking_duration_ns:
                         tracking = False
                         start_time = 0
                         if off_time == 0:
-                            off_time = time.time()
+                            off_time = now_ns
 
                 else:
                     tracking = False
                     start_time = 0
 
                 # Emit data at intervals
-                current_time = time.time()
-                if current_time - last_emit_time >= emit_interval:
-                    last_emit_time = current_time
-                    avg_weight = round(sum(weights) / len(weights) / 1000, 1) if weights else 0
-                    elapsed_time = round(time.time() - start_time, 2) if start_time and tracking else 0
-                    response = {
-                        'weight': round(current_weight / 1000, 1),
-                        'peak_weight': round(peak_weight / 1000, 1),
-                        'avg_weight': avg_weight,
-                        'elapsed_time': elapsed_time,
-                        'tracking': tracking,
-                        'clear_chart': len(weights) == 1
-                    }
-                    socketio.emit('response_data', response)
+                if now_ns - last_emit_time >= emit_interval:
+                    last_emit_time = now_ns
+                    response = build_response(now_ns)
+                    # Skip frames identical to the last one, e.g. while the scale is at rest
+                    if response != last_response:
+                        last_response = response
+                        socket_emit('response_data', response)
                     
         except ValueError as e:
             print(f"Error reading weight: {e}")
-        time.sleep(emit_interval)  # Adjust the sleep interval as needed
-
+        # get_weight() already blocks until the HX711 has data, so only
+        # sleep for whatever is left of the interval instead of a full one
+        remaining = emit_interval - (now() - loop_start)
+        if remaining > 0:
+            sleep(remaining / 1e9)
+
+# A real OS thread whatever async mode Flask-SocketIO picks. The RPi.GPIO calls
+# in read_sensor block in C and would stall an eventlet/gevent hub.
 thread = threading.Thread(target=read_sensor)
 thread.daemon = True
 thread.start()
@@ -114,6 +164,8 @@ def index():
 @socketio.on('connect')
 def handle_connect():
     print('Client connected')
+    # The sensor loop only emits on change, so send new clients the current state
+    emit('response_data', build_response(time.monotonic_ns()))
 
 @socketio.on('disconnect')
 def handle_disconnect():
@@ -122,18 +174,7 @@ def handle_disconnect():
 
 @socketio.on('request_data')
 def handle_request_data():
-    global weights, peak_weight, start_time, current_weight
-    avg_weight = round(sum(weights) / len(weights) / 1000, 1) if weights else 0
-    elapsed_time = round(time.time() - start_time, 2) if start_time and tracking else 0
-    response = {
-        'weight': round(current_weight / 1000, 1),
-        'peak_weight': round(peak_weight / 1000, 1),
-        'avg_weight': avg_weight,
-        'elapsed_time': elapsed_time,
-        'tracking': tracking,
-        'clear_chart': len(weights) == 1  # Clear chart if only one weight entry (new tracking started)
-    }
-    emit('response_data', response)
+    emit('response_data', build_response(time.monotonic_ns()))
 
 @socketio.on('set_min_weight')
 def handle_set_min_weight(json):
@@ -144,9 +185,10 @@ def handle_set_min_weight(json):
 
 @socketio.on('set_tracking_duration')
 def handle_set_tracking_duration(json):
-    global tracking_duration
+    global tracking_duration, tracking_duration_ns
     data = request.get_json()
     tracking_duration = float(data['tracking_duration'])
+    tracking_duration_ns = int(tracking_duration * 1e9)
     emit('tracking_duration_set', {'status': 'success', 'tracking_duration': tracking_duration})
 
 @socketio.on('tare')
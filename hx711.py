@@ -51,15 +51,20 @@ class HX711:
         self._last_raw_data_B = 0
         self._wanted_channel = ''
         self._current_channel = ''
+        self._gain_pulses = 2  # ones sent after the data bits, see _update_gain_pulses
+        self._gain_pulses_channel = 'B'  # channel selected by those pulses
         self._scale_ratio_A_128 = 1  # scale ratio for channel A and gain 128
         self._scale_ratio_A_64 = 1  # scale ratio for channel A and gain 64
         self._scale_ratio_B = 1  # scale ratio for channel B
         self._debug_mode = False
+        self._use_edge_wait = True  # False once GPIO.wait_for_edge has failed
         self._data_filter = self.outliers_filter  # default it is used outliers_filter
 
         GPIO.setup(self._pd_sck, GPIO.OUT)  # pin _pd_sck is output only
         GPIO.setup(self._dout, GPIO.IN)  # pin _dout is input only
-        self.select_channel(select_channel)
+        # set_gain_A below waits for the chip to settle, which covers
+        # the channel as well, so only one settling delay is paid at init
+        self._set_wanted_channel(select_channel)
         self.set_gain_A(gain_channel_A)
 
     def select_channel(self, channel):
@@ -67,6 +72,22 @@ class HX711:
         select_channel method evaluates if the desired channel
         is valid and then sets the _wanted_channel variable.
 
+        Args:
+            channel(str): the channel to select. Options ('A' || 'B')
+        Raises:
+            ValueError: if channel is not 'A' or 'B'
+        """
+        self._set_wanted_channel(channel)
+        # after changing channel or gain it has to wait 50 ms to allow adjustment.
+        # the data before is garbage and cannot be used.
+        self._read()
+        time.sleep(0.5)
+
+    def _set_wanted_channel(self, channel):
+        """
+        _set_wanted_channel validates the channel and sets the
+        _wanted_channel variable without waiting for the chip to settle.
+
         Args:
             channel(str): the channel to select. Options ('A' || 'B')
         Raises:
@@ -80,10 +101,7 @@ class HX711:
         else:
             raise ValueError('Parameter "channel" has to be "A" or "B". '
                              'Received: {}'.format(channel))
-        # after changing channel or gain it has to wait 50 ms to allow adjustment.
-        # the data before is garbage and cannot be used.
-        self._read()
-        time.sleep(0.5)
+        self._update_gain_pulses()
 
     def set_gain_A(self, gain):
         """
@@ -102,11 +120,28 @@ class HX711:
         else:
             raise ValueError('gain has to be 128 or 64. '
                              'Received: {}'.format(gain))
+        self._update_gain_pulses()
         # after changing channel or gain it has to wait 50 ms to allow adjustment.
         # the data before is garbage and cannot be used.
         self._read()
         time.sleep(0.5)
 
+    def _update_gain_pulses(self):
+        """
+        _update_gain_pulses precomputes how many ones _read sends after
+        the 24 data bits, so the per-reading channel and gain checks
+        are done only when channel or gain changes.
+        """
+        if self._wanted_channel == 'A' and self._gain_channel_A == 128:
+            self._gain_pulses = 1  # send only one bit which is 1
+            self._gain_pulses_channel = 'A'
+        elif self._wanted_channel == 'A' and self._gain_channel_A == 64:
+            self._gain_pulses = 3  # send three ones
+            self._gain_pulses_channel = 'A'
+        else:
+            self._gain_pulses = 2  # send two ones
+            self._gain_pulses_channel = 'B'
+
     def zero(self, readings=30):
         """
         zero is a method which sets the current data as
@@ -123,7 +158,7 @@ class HX711:
         """
         if readings > 0 and readings < 100:
             result = self.get_raw_data_mean(readings)
-            if result != False:
+            if result is not False:
                 if (self._current_channel == 'A' and
                         self._gain_channel_A == 128):
                     self._offset_A_128 = result
@@ -324,11 +359,13 @@ class HX711:
         Returns: bool True if HX711 is ready for the next reading
             False if HX711 is not ready for the next reading
         """
+        # local names keep the time PD_SCK stays HIGH as short as possible
+        output, pd_sck, perf_counter = GPIO.output, self._pd_sck, time.perf_counter
         for _ in range(num):
-            start_counter = time.perf_counter()
-            GPIO.output(self._pd_sck, True)
-            GPIO.output(self._pd_sck, False)
-            end_counter = time.perf_counter()
+            start_counter = perf_counter()
+            output(pd_sck, True)
+            output(pd_sck, False)
+            end_counter = perf_counter()
             # check if hx 711 did not turn off...
             if end_counter - start_counter >= 0.00006:
                 # if pd_sck pin is HIGH for 60 us and more than the HX 711 enters power down mode.
@@ -339,7 +376,7 @@ class HX711:
                 # hx711 has turned off. First few readings are inaccurate.
                 # Despite it, this reading was ok and data can be used.
                 result = self.get_raw_data_mean(6)  # set for the next reading.
-                if result == False:
+                if result is False:
                     return False
         return True
 
@@ -353,22 +390,35 @@ class HX711:
         """
         GPIO.output(self._pd_sck, False)  # start by setting the pd_sck to 0
         ready_counter = 0
-        while (not self._ready() and ready_counter <= 40):
-            time.sleep(0.01)  # sleep for 10 ms because data is not ready
-            ready_counter += 1
-            if ready_counter == 50:  # if counter reached max value then return False
+        while not self._ready():
+            if ready_counter == 40:  # if counter reached max value then return False
                 if self._debug_mode:
                     print('self._read() not ready after 40 trials\n')
                 return False
+            if self._use_edge_wait:
+                # block until DOUT goes LOW instead of sleeping a fixed 10 ms.
+                # The 10 ms timeout bounds the wait if the edge came before this call.
+                try:
+                    GPIO.wait_for_edge(self._dout, GPIO.FALLING, timeout=10)
+                except RuntimeError:
+                    # edge detection is not available with this GPIO backend
+                    self._use_edge_wait = False
+                    time.sleep(0.01)
+            else:
+                time.sleep(0.01)  # sleep for 10 ms because data is not ready
+            ready_counter += 1
 
         # read first 24 bits of data
+        # look up the GPIO functions and pins once, not on every clock pulse
+        output, read_pin = GPIO.output, GPIO.input
+        pd_sck, dout, perf_counter = self._pd_sck, self._dout, time.perf_counter
         data_in = 0  # 2's complement data from hx 711
         for _ in range(24):
-            start_counter = time.perf_counter()
+            start_counter = perf_counter()
             # request next bit from hx 711
-            GPIO.output(self._pd_sck, True)
-            GPIO.output(self._pd_sck, False)
-            end_counter = time.perf_counter()
+            output(pd_sck, True)
+            output(pd_sck, False)
+            end_counter = perf_counter()
             if end_counter - start_counter >= 0.00006:  # check if the hx 711 did not turn off...
                 # if pd_sck pin is HIGH for 60 us and more than the HX 711 enters power down mode.
                 if self._debug_mode:
@@ -378,25 +428,12 @@ class HX711:
                 return False
             # Shift the bits as they come to data_in variable.
             # Left shift by one bit then bitwise OR with the new bit.
-            data_in = (data_in << 1) | GPIO.input(self._dout)
+            data_in = (data_in << 1) | read_pin(dout)
 
-        if self._wanted_channel == 'A' and self._gain_channel_A == 128:
-            if not self._set_channel_gain(1):  # send only one bit which is 1
-                return False  # return False because channel was not set properly
-            else:
-                self._current_channel = 'A'  # else set current channel variable
-                self._gain_channel_A = 128  # and gain
-        elif self._wanted_channel == 'A' and self._gain_channel_A == 64:
-            if not self._set_channel_gain(3):  # send three ones
-                return False  # return False because channel was not set properly
-            else:
-                self._current_channel = 'A'  # else set current channel variable
-                self._gain_channel_A = 64
-        else:
-            if not self._set_channel_gain(2):  # send two ones
-                return False  # return False because channel was not set properly
-            else:
-                self._current_channel = 'B'  # else set current channel variable
+        # send the precomputed number of ones for the wanted channel and gain
+        if not self._set_channel_gain(self._gain_pulses):
+            return False  # return False because channel was not set properly
+        self._current_channel = self._gain_pulses_channel  # else set current channel variable
 
         if self._debug_mode:  # print 2's complement value
             print('Binary value as received: {}'.format(bin(data_in)))
@@ -437,22 +474,26 @@ class HX711:
         # do backup of current channel befor reading for later use
         backup_channel = self._current_channel
         backup_gain = self._gain_channel_A
-        data_list = []
         # do required number of readings
-        for _ in range(readings):
-            data_list.append(self._read())
+        data_list = [self._read() for _ in range(readings)]
         data_mean = False
         if readings > 2 and self._data_filter:
             filtered_data = self._data_filter(data_list)
             if not filtered_data:
                 return False
+            # plain sum / len is much cheaper than stat.mean which
+            # accumulates through fractions for exactness
+            data_mean = sum(filtered_data) / len(filtered_data)
             if self._debug_mode:
                 print('data_list: {}'.format(data_list))
                 print('filtered_data list: {}'.format(filtered_data))
-                print('data_mean:', stat.mean(filtered_data))
-            data_mean = stat.mean(filtered_data)
+                print('data_mean:', data_mean)
         else:
-            data_mean = stat.mean(data_list)
+            # skip failed readings instead of averaging False in as 0
+            valid_data = [data for data in data_list if data is not False]
+            if not valid_data:
+                return False
+            data_mean = sum(valid_data) / len(valid_data)
         self._save_last_raw_data(backup_channel, backup_gain, data_mean)
         return int(data_mean)
 
@@ -468,7 +509,7 @@ class HX711:
             If it returns int then reading was ok
         """
         result = self.get_raw_data_mean(readings)
-        if result != False:
+        if result is not False:
             if self._current_channel == 'A' and self._gain_channel_A == 128:
                 return result - self._offset_A_128
             elif self._current_channel == 'A' and self._gain_channel_A == 64:
@@ -491,7 +532,7 @@ class HX711:
             If it returns float then reading was ok
         """
         result = self.get_raw_data_mean(readings)
-        if result != False:
+        if result is not False:  # a raw mean of 0 is a valid reading
             if self._current_channel == 'A' and self._gain_channel_A == 128:
                 return float(
                     (result - self._offset_A_128) / self._scale_ratio_A_128)
@@ -653,7 +694,7 @@ class HX711:
         self.power_down()
         self.power_up()
         result = self.get_raw_data_mean(6)
-        if result:
+        if result is not False:
             return False
         else:
             return True
@@ -0,0 +1,64 @@
+import math
+from collections import deque
+
+
+class RunningDeque:
+    """Bounded deque that keeps a running sum and sum of squares so mean and
+    standard deviation are O(1) per sample instead of a pass over the buffer."""
+
+    def __init__(self, maxlen):
+        self._data = deque(maxlen=maxlen)
+        self._shift = 0.0  # reference value subtracted before summing
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._appends = 0  # appends since the sums were last recomputed
+
+    def append(self, value):
+        data = self._data
+        if len(data) == data.maxlen:
+            oldest = data[0] - self._shift  # the deque drops this one on append
+            self._sum -= oldest
+            self._sum_sq -= oldest * oldest
+        data.append(value)
+        self._appends += 1
+        if self._appends >= data.maxlen:
+            # recompute from the data so rounding error cannot build up
+            self._resync()
+        else:
+            value -= self._shift
+            self._sum += value
+            self._sum_sq += value * value
+
+    def _resync(self):
+        data = self._data
+        # shifting by a recent sample keeps the sums small, which avoids
+        # cancellation in E[x^2] - mean^2 when the weight is large
+        self._shift = shift = data[-1]
+        self._sum = sum(x - shift for x in data)
+        self._sum_sq = sum((x - shift) * (x - shift) for x in data)
+        self._appends = 0
+
+    def clear(self):
+        self._data.clear()
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._appends = 0
+
+    def mean(self):
+        return self._shift + self._sum / len(self._data)
+
+    def std(self):
+        # population standard deviation, same as np.std
+        n = len(self._data)
+        mean = self._sum / n
+        return math.sqrt(max(self._sum_sq / n - mean * mean, 0.0))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        return self._data[index]
+
+    def __iter__(self):
+        return iter(self._data)
@@ -0,0 +1,115 @@
+import sys
+import types
+import unittest
+from unittest import mock
+
+
+class FakeGPIO(types.ModuleType):
+    """Minimal RPi.GPIO stand-in. DOUT reads come from input_values, and 0
+    (data ready) is returned once the list runs out."""
+
+    BCM = 11
+    IN = 1
+    OUT = 0
+    FALLING = 32
+
+    def __init__(self):
+        super().__init__('RPi.GPIO')
+        self.input_values = []
+        self.wait_for_edge_error = None
+        self.wait_for_edge_calls = 0
+
+    def setmode(self, mode):
+        pass
+
+    def setup(self, pin, direction):
+        pass
+
+    def output(self, pin, value):
+        pass
+
+    def input(self, pin):
+        if self.input_values:
+            return self.input_values.pop(0)
+        return 0
+
+    def wait_for_edge(self, pin, edge, timeout=None):
+        self.wait_for_edge_calls += 1
+        if self.wait_for_edge_error:
+            raise self.wait_for_edge_error
+
+    def cleanup(self):
+        pass
+
+
+GPIO = FakeGPIO()
+rpi = types.ModuleType('RPi')
+rpi.GPIO = GPIO
+sys.modules['RPi'] = rpi
+sys.modules['RPi.GPIO'] = GPIO
+
+import hx711  # noqa: E402  (needs the RPi.GPIO stub above)
+
+
+def data_bits(value):
+    """DOUT values for one 24-bit reading, most significant bit first."""
+    return [(value >> bit) & 1 for bit in range(23, -1, -1)]
+
+
+class HX711Test(unittest.TestCase):
+
+    def setUp(self):
+        GPIO.input_values = []
+        GPIO.wait_for_edge_error = None
+        GPIO.wait_for_edge_calls = 0
+        with mock.patch.object(hx711.time, 'sleep'):
+            self.hx = hx711.HX711(dout_pin=5, pd_sck_pin=6)
+        GPIO.wait_for_edge_calls = 0
+
+    def test_read_returns_false_when_never_ready(self):
+        GPIO.input_values = [1] * 100
+        self.assertIs(self.hx._read(), False)
+        self.assertEqual(GPIO.wait_for_edge_calls, 40)
+
+    def test_read_falls_back_to_polling_when_wait_for_edge_fails(self):
+        GPIO.wait_for_edge_error = RuntimeError('Failed to add edge detection')
+        GPIO.input_values = [1, 0] + data_bits(5)
+        with mock.patch.object(hx711.time, 'sleep') as sleep:
+            self.assertEqual(self.hx._read(), 5)
+        self.assertFalse(self.hx._use_edge_wait)
+        sleep.assert_called_once_with(0.01)
+
+        # later reads poll without trying the edge wait again
+        GPIO.input_values = [1, 0] + data_bits(7)
+        with mock.patch.object(hx711.time, 'sleep'):
+            self.assertEqual(self.hx._read(), 7)
+        self.assertEqual(GPIO.wait_for_edge_calls, 1)
+
+    def test_get_raw_data_mean_skips_failed_reads(self):
+        with mock.patch.object(self.hx, '_read', side_effect=[10, False]):
+            self.assertEqual(self.hx.get_raw_data_mean(2), 10)
+
+    def test_get_raw_data_mean_returns_false_when_all_reads_fail(self):
+        with mock.patch.object(self.hx, '_read', side_effect=[False, False]):
+            self.assertIs(self.hx.get_raw_data_mean(2), False)
+
+
+    def test_zero_accepts_a_raw_mean_of_zero(self):
+        with mock.patch.object(self.hx, 'get_raw_data_mean', return_value=0):
+            self.assertFalse(self.hx.zero())  # True would mean an error
+            self.assertIs(self.hx.reset(), False)
+        self.assertEqual(self.hx.get_current_offset(), 0)
+
+    def test_zero_reports_failed_reads(self):
+        with mock.patch.object(self.hx, 'get_raw_data_mean', return_value=False):
+            self.assertTrue(self.hx.zero())
+            self.assertTrue(self.hx.reset())
+
+    def test_get_data_mean_accepts_a_raw_mean_of_zero(self):
+        self.hx.set_offset(-3)
+        with mock.patch.object(self.hx, 'get_raw_data_mean', return_value=0):
+            self.assertEqual(self.hx.get_data_mean(2), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import random
+import statistics
+import unittest
+
+from running_deque import RunningDeque
+
+
+class RunningDequeTest(unittest.TestCase):
+
+    def test_mean_and_std_match_window(self):
+        window = RunningDeque(maxlen=10)
+        values = [3.0, 7.5, -1.0, 12.25, 4.0, 4.0, 9.0, 0.5, 2.0, 8.0, 6.0, 11.0]
+        for value in values:
+            window.append(value)
+        self.assertEqual(list(window), values[-10:])
+        self.assertAlmostEqual(window.mean(), statistics.mean(values[-10:]))
+        self.assertAlmostEqual(window.std(), statistics.pstdev(values[-10:]))
+
+    def test_clear(self):
+        window = RunningDeque(maxlen=5)
+        for value in (1.0, 2.0, 3.0):
+            window.append(value)
+        window.clear()
+        self.assertEqual(len(window), 0)
+        window.append(10.0)
+        self.assertEqual(window.mean(), 10.0)
+        self.assertEqual(window.std(), 0.0)
+
+    def test_std_does_not_drift_over_millions_of_samples(self):
+        rng = random.Random(1234)
+        maxlen = 100
+        window = RunningDeque(maxlen=maxlen)
+        for i in range(3_000_000):
+            # switch between an empty scale, a heavy load with a tiny noise
+            # floor and large spikes so the sums see mixed magnitudes
+            phase = (i // 50_000) % 3
+            if phase == 0:
+                value = rng.gauss(0.0, 2.0)
+            elif phase == 1:
+                value = 150_000.0 + rng.gauss(0.0, 0.05)
+            else:
+                value = rng.choice((1e-3, 1e6, 42.0)) * rng.random()
+            window.append(value)
+            if i % 49_999 == 0 and len(window) == maxlen:
+                expected = statistics.pstdev(list(window))
+                self.assertAlmostEqual(window.std(), expected,
+                                       delta=max(expected * 1e-6, 1e-9))
+                self.assertAlmostEqual(window.mean(), statistics.fmean(window),
+                                       delta=max(abs(statistics.fmean(window)) * 1e-9, 1e-9))
+
+
+if __name__ == '__main__':
+    unittest.main()